@@ -54,6 +54,16 @@ class Connection(object):
         # Initially, leave the server to determine the cluster master status
         self.__cluster_master = cluster_master
 
+        # Cache the name server proxy and object URI lookups, so that
+        # obtaining multiple objects does not perform a name server
+        # connection and lookup round trip per object
+        self._ns = None
+        self._uri_cache = {}
+
+        # Cache of the built auth annotations for the common
+        # session-based path, rebuilt when the connection flags change
+        self._auth_obj_cache = None
+
         # Store the passed session_id so that it may be used for the initial connection
         self.__session_id = session_id
 
@@ -88,6 +98,13 @@ class Connection(object):
 
     def _get_auth_obj(self, password=None):
         """Setup annotations for authentication."""
+        # Re-use the previously-built annotations for the common
+        # session-based path, e.g. when annotating multiple objects.
+        # Password-based requests are always built fresh, as the
+        # password is not cached
+        if password is None and self._auth_obj_cache is not None:
+            return self._auth_obj_cache
+
         auth_dict = {
             Annotations.USERNAME: self.__username
         }
@@ -111,13 +128,20 @@ class Connection(object):
         auth_dict[Annotations.IGNORE_DRBD] = self._ignore_drbd
         if 'ignore_drbd' in dir(Pyro4.current_context):
             auth_dict[Annotations.IGNORE_DRBD] |= Pyro4.current_context.ignore_drbd
+
+        if password is None:
+            self._auth_obj_cache = auth_dict
         return auth_dict
 
+    def _get_name_server(self):
+        """Obtain a connection to the name server, re-using a cached proxy."""
+        if self._ns is None:
+            self._ns = Pyro4.naming.locateNS(host=self.__host,
+                                             port=self.NS_PORT, broadcast=False)
+        return self._ns
+
     def get_connection(self, object_name, password=None):
         """Obtain a connection from pyro for a given object."""
-        # Obtain a connection to the name server on the localhost
-        nameserver = Pyro4.naming.locateNS(host=self.__host,
-                                           port=self.NS_PORT, broadcast=False)
 
         class AuthProxy(Pyro4.Proxy):
             """Create an auth proxy that appends specfic handshake data."""
@@ -126,19 +150,75 @@ class Connection(object):
                 """Override upstream handshake."""
                 self._pyroHandshake[Annotations.SESSION_ID] = data
 
-        # Create a Proxy object, using the overriden Proxy class and return.
-        proxy = AuthProxy(nameserver.lookup(object_name))
-        proxy._pyroHandshake = self._get_auth_obj(password=password)
-        proxy._pyroBind()
+        try:
+            # Resolve the URI for the object, re-using previous lookups
+            if object_name not in self._uri_cache:
+                self._uri_cache[object_name] = self._get_name_server().lookup(object_name)
+
+            # Create a Proxy object, using the overriden Proxy class and return.
+            proxy = AuthProxy(self._uri_cache[object_name])
+            proxy._pyroHandshake = self._get_auth_obj(password=password)
+            proxy._pyroBind()
+        except Pyro4.errors.CommunicationError:
+            # Discard cached name server state, as it may be stale,
+            # before re-raising
+            self._ns = None
+            self._uri_cache.pop(object_name, None)
+            raise
         return proxy
 
+    def get_connections(self, object_names, password=None):
+        """Obtain proxies for multiple objects, resolving all of the
+        URIs in a single name server query, rather than performing a
+        lookup round trip per object.
+        """
+        # Resolve any un-cached object URIs in one name server call
+        unresolved = [object_name for object_name in object_names
+                      if object_name not in self._uri_cache]
+        if unresolved:
+            try:
+                registrations = self._get_name_server().list()
+            except Pyro4.errors.CommunicationError:
+                self._ns = None
+                raise
+            for object_name in unresolved:
+                if object_name in registrations:
+                    self._uri_cache[object_name] = registrations[object_name]
+
+        # Bind a proxy for each object. Any objects that were not
+        # registered with the name server fall through to the lookup in
+        # get_connection, which raises the usual naming error
+        return [self.get_connection(object_name, password=password)
+                for object_name in object_names]
+
+    def build_auth_cache(self):
+        """Build the cached auth annotations on the current thread.
+
+        Must be called before handing the connection to another thread,
+        as the annotations include flags read from the thread-local Pyro
+        context of the calling request, which other threads do not see.
+        """
+        self._get_auth_obj()
+
+    def claim_thread_ownership(self):
+        """Claim ownership of cached Pyro proxies for the calling thread.
+
+        Pyro proxies may only be used by the thread that owns them, so a
+        thread that has been handed this connection must claim ownership
+        before using it.
+        """
+        if self._ns is not None:
+            self._ns._pyroClaimOwnership()
+
     def ignore_drbd(self):
         """Set flag to ignore DRBD."""
         self._ignore_drbd = True
+        self._auth_obj_cache = None
 
     def ignore_cluster(self):
         """Set flag to ignore cluster."""
         self.__ignore_cluster = True
+        self._auth_obj_cache = None
 
     def annotate_object(self, object_ref):
         """Add authentication attributes to remote object."""
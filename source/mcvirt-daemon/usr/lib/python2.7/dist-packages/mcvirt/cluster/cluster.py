@@ -20,6 +20,8 @@
 import json
 import base64
 import socket
+import sys
+from threading import Thread
 from texttable import Texttable
 
 import Pyro4
@@ -127,7 +129,7 @@ class Cluster(PyroObject):
             """Check node config on remote node."""
             node = connection.get_connection('node')
             return node.get_version()
-        node_versions = self.run_remote_command(check_version)
+        node_versions = self.run_remote_command(check_version, parallel=True)
         local_version = self.po__get_registered_object('node').get_version()
         for node in node_versions:
             if node_versions[node] != local_version:
@@ -741,8 +743,14 @@ class Cluster(PyroObject):
 
     def run_remote_command(self, callback_method, nodes=None,
                            args=None, kwargs=None,
-                           ignore_cluster_master=False, node=None):
-        """Run a remote command on all (or a given list of) remote nodes."""
+                           ignore_cluster_master=False, node=None,
+                           parallel=False):
+        """Run a remote command on all (or a given list of) remote nodes.
+
+        If parallel is set, the callback is run against each node in a
+        separate thread, which should only be used where the per-node
+        calls are independent of one another.
+        """
         return_data = {}
         if args is None:
             args = []
@@ -764,6 +772,13 @@ class Cluster(PyroObject):
         if node is not None and node not in nodes:
             nodes.append(node)
 
+        # Dispatch the callbacks concurrently, where requested, so that
+        # the wall time is that of the slowest node, rather than the sum
+        # of all nodes
+        if parallel and len(nodes) > 1:
+            return self._run_remote_command_parallel(
+                callback_method, nodes, args, kwargs, ignore_cluster_master)
+
         # Iterate through each node
         for node in nodes:
             # Obtain connection to node
@@ -779,6 +794,57 @@ class Cluster(PyroObject):
         # Return dict of returned values
         return return_data
 
+    def _run_remote_command_parallel(self, callback_method, nodes, args,
+                                     kwargs, ignore_cluster_master):
+        """Run a remote command callback against each node in a separate
+        thread, collecting the return values and re-raising the first
+        exception raised by any node.
+        """
+        return_data = {}
+        errors = []
+
+        # Obtain the connections on the calling thread, as obtaining a
+        # connection interacts with the Pyro context, which is thread-local
+        node_objects = {}
+        for node in nodes:
+            node_object = self.get_remote_node(
+                node, ignore_cluster_master=ignore_cluster_master)
+            if node_object is not None:
+                # Build the auth annotations now, as they include flags
+                # (has_lock/ignore_cluster/ignore_drbd) from the
+                # thread-local Pyro context of this request, which the
+                # worker threads do not see
+                node_object.build_auth_cache()
+            node_objects[node] = node_object
+
+        def run_on_node(node):
+            """Run the callback against a single node, capturing errors."""
+            try:
+                # Claim ownership of the connection's cached proxies, as
+                # Pyro proxies may only be used by their owning thread
+                node_objects[node].claim_thread_ownership()
+                return_data[node] = callback_method(node_objects[node],
+                                                    *args, **kwargs)
+            except Exception:
+                errors.append(sys.exc_info())
+
+        threads = []
+        for node in nodes:
+            # Skip nodes that were inaccessible and ignored
+            if node_objects[node] is None:
+                continue
+            thread = Thread(target=run_on_node, args=(node,))
+            threads.append(thread)
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        if errors:
+            raise errors[0][0], errors[0][1], errors[0][2]
+
+        return return_data
+
     def check_node_exists(self, node_name, include_local=False):
         """Determine if a node is already present in the cluster."""
         return node_name in self.get_nodes(return_all=True, include_local=include_local)
@@ -133,6 +133,10 @@ class Drbd(PyroObject):
             config['drbd']['enabled'] = True
         MCVirtConfig().update_config(update_config, 'Enabled Drbd')
 
+        # Enabling DRBD changes the storage types available on the node
+        self.po__get_registered_object(
+            'hard_drive_factory').invalidate_available_storage_types()
+
     def get_config(self):
         """Return the global Drbd configuration."""
         mcvirt_config = MCVirtConfig()
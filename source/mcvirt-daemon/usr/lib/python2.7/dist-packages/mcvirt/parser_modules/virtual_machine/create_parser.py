@@ -81,14 +81,15 @@ class CreateParser(object):
     def handle_create(self, p_, args):
         """Handle create."""
         if args.storage_backend:
-            storage_factory = p_.rpc.get_connection('storage_factory')
+            # Obtain both factories in a single name server query
+            storage_factory, vm_factory = p_.rpc.get_connections(
+                ['storage_factory', 'virtual_machine_factory'])
             storage_backend = storage_factory.get_object_by_name(args.storage_backend)
             p_.rpc.annotate_object(storage_backend)
         else:
             storage_backend = None
+            vm_factory = p_.rpc.get_connection('virtual_machine_factory')
         storage_type = args.storage_type or None
-
-        vm_factory = p_.rpc.get_connection('virtual_machine_factory')
         hard_disks = [args.disk_size] if args.disk_size is not None else []
         mod_flags = args.modification_flags or []
         vm_factory.create(
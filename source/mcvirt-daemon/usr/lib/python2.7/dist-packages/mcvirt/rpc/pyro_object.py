@@ -82,7 +82,10 @@ class PyroObject(object):
     @property
     def po__is_pyro_initialised(self):
         """Determine if object is registered with the Pyro deamon."""
-        return '_pyroDaemon' in self.__dict__.keys()
+        # Probe the dict directly - keys() would build a list of all
+        # attributes on every call and this property is on the hot path
+        # of every Pyro call
+        return '_pyroDaemon' in self.__dict__
 
     @property
     def po__cluster_disabled(self):
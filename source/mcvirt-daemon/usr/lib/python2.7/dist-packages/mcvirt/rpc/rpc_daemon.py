@@ -243,6 +243,9 @@ class RpcNSMixinDaemon(object):
         Pyro4.config.USE_MSG_WAITALL = False
         Pyro4.config.CREATE_SOCKET_METHOD = SSLSocket.create_ssl_socket
         Pyro4.config.CREATE_BROADCAST_SOCKET_METHOD = SSLSocket.create_broadcast_ssl_socket
+        # Explicitly use the threaded server, so that RPCs performing
+        # blocking shell-outs do not prevent other requests being served
+        Pyro4.config.SERVERTYPE = 'thread'
         Pyro4.config.THREADPOOL_ALLOW_QUEUE = True
         Pyro4.config.THREADPOOL_SIZE = 128
         self.hostname = get_hostname()
@@ -100,6 +100,7 @@ class Base(PyroObject):
     def __init__(self, id_):
         """Setup member variables."""
         self._id = id_
+        self._location_cache = {}
 
     def __eq__(self, comp):
         """Allow for comparison of storage objects baesd on name."""
@@ -227,6 +228,8 @@ class Base(PyroObject):
             self.po__unregister_object()
             del storage_factory.CACHED_OBJECTS[self._id]
 
+        storage_factory._invalidate_available_storage_types()
+
     def get_config_object(self):
         """Return the config object for the storage backend."""
         return StorageConfig(self)
@@ -257,6 +260,9 @@ class Base(PyroObject):
         self.update_config(update_location_config,
                            'Update location for %s' % self.name)
 
+        # Remove any cached locations, as they may have changed
+        self._location_cache = {}
+
         if self.po__is_cluster_master:
             def update_remote_node(conn):
                 """Update location on remote nodes."""
@@ -326,6 +332,11 @@ class Base(PyroObject):
             update_storage_backend_config,
             'Add node %s to storage backend %s' % (node_name, self.name))
 
+        # Remove any cached locations, as the node configuration has changed
+        self._location_cache = {}
+        self.po__get_registered_object(
+            'storage_factory')._invalidate_available_storage_types()
+
     def update_config(self, callback, reason):
         """Update backend storage configuration."""
         self.get_config_object().update_config(callback, reason)
@@ -406,6 +417,11 @@ class Base(PyroObject):
             update_storage_backend_config,
             'Remove node %s to storage backend %s' % (node_name, self.name))
 
+        # Remove any cached locations, as the node configuration has changed
+        self._location_cache = {}
+        self.po__get_registered_object(
+            'storage_factory')._invalidate_available_storage_types()
+
     @Expose(locking=True)
     def set_shared(self, shared):
         """Set the shared status of the storage backend."""
@@ -458,17 +474,25 @@ class Base(PyroObject):
         if node is None:
             node = get_hostname()
 
+        # Return cached location, where available, to avoid
+        # re-reading the config on every lookup
+        cache_key = (node, return_default)
+        if cache_key in self._location_cache:
+            return self._location_cache[cache_key]
+
         # Raise exception if node is not configured for storage backend
         if node not in self.nodes:
             raise UnsuitableNodeException(
                 'Node does not support storage backend: %s, %s' % (node, self.name)
             )
         config = self.get_config()
-        return (config['nodes'][node]['location']
-                if 'location' in config['nodes'][node] and
-                config['nodes'][node]['location'] and
-                not return_default
-                else config['location'])
+        location = (config['nodes'][node]['location']
+                    if 'location' in config['nodes'][node] and
+                    config['nodes'][node]['location'] and
+                    not return_default
+                    else config['location'])
+        self._location_cache[cache_key] = location
+        return location
 
     def available_on_node(self, node=None, raise_on_err=True):
         """Determine if the storage volume is available on
@@ -536,6 +560,7 @@ class BaseVolume(PyroObject):
         self._name = name
         self._validate_name()
         self._storage_backend = storage_backend
+        self._cached_path = None
 
     @property
     def name(self):
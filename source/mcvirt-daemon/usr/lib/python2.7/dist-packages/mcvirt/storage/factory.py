@@ -41,6 +41,8 @@ class Factory(PyroObject):
     OBJECT_TYPE = 'storage backend'
     CACHED_OBJECTS = {}
     STORAGE_CONFIG_KEY = 'storage_backends'
+    # Map of storage type name to class, computed on first use
+    _storage_type_map = None
 
     def get_remote_object(self,
                           node=None,     # The name of the remote node to connect to
@@ -218,6 +220,16 @@ class Factory(PyroObject):
     def create_config(self, id_, config):
         """Create config for the storage backend."""
         StorageConfig.create(id_, config)
+        self._invalidate_available_storage_types()
+
+    def _invalidate_available_storage_types(self):
+        """Notify the hard drive factory that the available storage
+        backends have changed, as this affects which storage types
+        are available on the node.
+        """
+        hard_drive_factory = self.po__get_registered_object('hard_drive_factory')
+        if hard_drive_factory is not None:
+            hard_drive_factory.invalidate_available_storage_types()
 
     @Expose()
     def undo__create_config(self, id_, config):
@@ -226,6 +238,7 @@ class Factory(PyroObject):
             """Update MCVirt config."""
             del mcvirt_config['storage_backends'][id_]
         MCVirtConfig().update_config(update_config, 'Remove storage backend %s' % config['name'])
+        self._invalidate_available_storage_types()
 
     @Expose()
     def list(self):
@@ -324,9 +337,15 @@ class Factory(PyroObject):
 
     def get_class(self, storage_type):
         """Obtain the storage class for a given storage type."""
-        for storage_class in self.get_storage_types():
-            if storage_type == storage_class.__name__:
-                return storage_class
+        # Compute the name-to-class map once, providing O(1) dispatch,
+        # rather than iterating the storage types on every call
+        if Factory._storage_type_map is None:
+            Factory._storage_type_map = {
+                storage_class.__name__: storage_class
+                for storage_class in self.get_storage_types()}
+
+        if storage_type in Factory._storage_type_map:
+            return Factory._storage_type_map[storage_type]
         raise UnknownStorageTypeException(
             'Attempted to initialise an unknown storage type: %s' %
             (storage_type)
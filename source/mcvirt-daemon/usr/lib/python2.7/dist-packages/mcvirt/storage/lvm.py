@@ -15,7 +15,9 @@
 # You should have received a copy of the GNU General Public License
 # along with MCVirt.  If not, see <http://www.gnu.org/licenses/>
 
+import json
 import os
+import time
 
 from mcvirt.storage.base import Base, BaseVolume
 from mcvirt.exceptions import (InvalidStorageConfiguration,
@@ -27,6 +29,18 @@ from mcvirt.system import System
 from mcvirt.constants import DirectoryLocation
 from mcvirt.argument_validator import ArgumentValidator
 
+# Attempt to load the libblockdev LVM bindings, which perform LVM
+# operations through the LVM C API in-process, avoiding a fork+exec of
+# the LVM tools for every volume operation. Fall back to shelling out
+# to the LVM tools where the bindings are not available
+try:
+    import gi
+    gi.require_version('BlockDev', '2.0')
+    from gi.repository import BlockDev, GLib
+    BlockDev.ensure_init(BlockDev.plugin_specs_from_names(['lvm']))
+except Exception:
+    BlockDev = None
+
 
 class Lvm(Base):
     """Storage backend for LVM based storage."""
@@ -39,9 +53,13 @@ class Lvm(Base):
     @classmethod
     def check_exists_local(cls, volume_group):
         """Determine if the volume group actually exists on the node."""
-        exit_code, _, _ = System.runCommand(['vgs', volume_group, '--noheadings', '--nosuffix'],
-                                            False, DirectoryLocation.BASE_STORAGE_DIR)
-        return not bool(exit_code)
+        exit_code, out, _ = System.runCommand(['vgs', '--noheadings', '-o', 'vg_name',
+                                               volume_group],
+                                              False, DirectoryLocation.BASE_STORAGE_DIR)
+        # vgs exits non-zero if the volume group does not exist. Also
+        # verify the reported name, rather than relying on the exit
+        # code alone
+        return not bool(exit_code) and out.strip() == volume_group
 
     @classmethod
     def ensure_exists(cls, location):
@@ -73,28 +91,62 @@ class Lvm(Base):
 
     @Expose(remote_nodes=True)
     def get_free_space(self):
-        """Return the free space in megabytes."""
+        """Return the free space in bytes."""
+        if BlockDev is not None:
+            try:
+                return int(BlockDev.lvm_vginfo(self.get_location()).free)
+            except GLib.Error, exc:
+                raise ExternalStorageCommandErrorException(
+                    "Error whilst obtaining free space of volume group:\n" + str(exc)
+                )
+
         _, out, _ = System.runCommand(['vgs', self.get_location(),
-                                       # Specify free space without headings or suffix
-                                       '-o', 'free', '--noheadings', '--nosuffix',
-                                       # Specify unit size in megabytes. Note from the man:
-                                       # "Capitalise to use multiples of 1000 (S.I.)
-                                       # instead of 1024."
-                                       '--units', 'b'],
+                                       # Obtain free space as bytes, in JSON format,
+                                       # which can be parsed reliably, rather than
+                                       # stripping headerless text output
+                                       '-o', 'free', '--reportformat', 'json',
+                                       '--nosuffix', '--units', 'b'],
                                       False,
                                       DirectoryLocation.BASE_STORAGE_DIR)
-        return int(out)
+        return int(json.loads(out)['report'][0]['vg'][0]['vg_free'])
 
 
 class LvmVolume(BaseVolume):
     """Overriden volume object from base."""
 
+    # Period (in seconds) for which cached check_exists/is_active
+    # results are re-used during batch operations
+    STATE_CACHE_TTL = 1
+
+    def __init__(self, *args, **kwargs):
+        """Setup caches for volume state."""
+        super(LvmVolume, self).__init__(*args, **kwargs)
+        # Tuple of (device node mtime, size in bytes)
+        self._size_cache = None
+        # Tuples of (timestamp, result)
+        self._exists_cache = None
+        self._active_cache = None
+
+    def _invalidate_state_cache(self):
+        """Clear cached volume state after the volume is modified."""
+        self._size_cache = None
+        self._exists_cache = None
+        self._active_cache = None
+
     def _validate_name(self):
         """Ensurue name of object is valid."""
         ArgumentValidator.validate_logical_volume_name(self.name)
 
     def get_path(self, node=None):
         """Return the full path of a given logical volume."""
+        # The name and volume group of a live volume object do not change,
+        # so the local path is computed once and cached, avoiding
+        # re-obtaining the storage backend location on every volume operation
+        if node is None:
+            if self._cached_path is None:
+                self._cached_path = ('/dev/' + self.storage_backend.get_location() +
+                                     '/' + self.name)
+            return self._cached_path
         return '/dev/' + self.storage_backend.get_location(node=node) + '/' + self.name
 
     @Expose(locking=True, remote_nodes=True, support_callback=True)
@@ -106,11 +158,26 @@ class LvmVolume(BaseVolume):
         if self.check_exists():
             raise VolumeAlreadyExistsError('Volume (%s) already exists' % self.name)
 
+        # Create through the LVM bindings, where available
+        if BlockDev is not None:
+            try:
+                BlockDev.lvm_lvcreate(self.storage_backend.get_location(),
+                                      self.name, int(size))
+            except GLib.Error, exc:
+                raise ExternalStorageCommandErrorException(
+                    "Error whilst creating disk logical volume:\n" + str(exc)
+                )
+            self._invalidate_state_cache()
+            return
+
         # Create command list
         command_args = ['/sbin/lvcreate',
                         self.storage_backend.get_location(),  # Specify volume group
                         '--name', self.name,
-                        '--size', '%sB' % size]
+                        '--size', '%sB' % size,
+                        # Explicitly activate the volume on creation, so that
+                        # a separate lvchange is not required afterwards
+                        '--activate', 'y']
         try:
             # Create on local node
             System.runCommand(command_args)
@@ -120,6 +187,8 @@ class LvmVolume(BaseVolume):
                 "Error whilst creating disk logical volume:\n" + str(exc)
             )
 
+        self._invalidate_state_cache()
+
     @Expose(locking=True, remote_nodes=True)
     def undo__create(self, *args, **kwargs):
         """Undo function for create."""
@@ -131,15 +200,27 @@ class LvmVolume(BaseVolume):
         self.po__get_registered_object('auth').assert_user_type(
             'ClusterUser', allow_indirect=True)
 
-        # Create command arguments
-        command_args = ['lvremove', '-f', self.get_path()]
-
         # Determine if logical volume exists before attempting to remove it
         if not self.check_exists() and not ignore_non_existent:
             raise VolumeDoesNotExistError(
                 'Volume (%s) does not exist' % self.name
             )
 
+        # Remove through the LVM bindings, where available
+        if BlockDev is not None:
+            try:
+                BlockDev.lvm_lvremove(self.storage_backend.get_location(),
+                                      self.name, True)
+            except GLib.Error, exc:
+                raise ExternalStorageCommandErrorException(
+                    "Error whilst removing logical volume:\n" + str(exc)
+                )
+            self._invalidate_state_cache()
+            return
+
+        # Create command arguments
+        command_args = ['lvremove', '-f', self.get_path()]
+
         try:
             System.runCommand(command_args)
 
@@ -148,6 +229,8 @@ class LvmVolume(BaseVolume):
                 "Error whilst removing logical volume:\n" + str(exc)
             )
 
+        self._invalidate_state_cache()
+
     @Expose(locking=True, remote_nodes=True, support_callback=True)
     def activate(self, _f=None):
         """Activate volume."""
@@ -155,6 +238,25 @@ class LvmVolume(BaseVolume):
             'ClusterUser', allow_indirect=True)
         # Ensure volume exists
         self.ensure_exists()
+
+        # Skip the lvchange if the volume is already active, which is
+        # the common case immediately after creation, as lvcreate
+        # activates the volume
+        if os.path.exists(self.get_path()):
+            return
+
+        # Activate through the LVM bindings, where available
+        if BlockDev is not None:
+            try:
+                BlockDev.lvm_lvactivate(self.storage_backend.get_location(),
+                                        self.name, True)
+            except GLib.Error, exc:
+                raise ExternalStorageCommandErrorException(
+                    "Error whilst activating logical volume:\n" + str(exc)
+                )
+            self._invalidate_state_cache()
+            return
+
         # Create command arguments
         command_args = ['lvchange', '-a', 'y', '--yes', self.get_path()]
         try:
@@ -166,11 +268,23 @@ class LvmVolume(BaseVolume):
                 "Error whilst activating logical volume:\n" + str(exc)
             )
 
+        self._invalidate_state_cache()
+
     def is_active(self):
         """Return whether volume is activated."""
         # Ensure volume exists
         self.ensure_exists()
-        return os.path.exists(self.get_path())
+
+        # Re-use a recently-cached result, avoiding a stat syscall per
+        # disk whilst enumerating volumes
+        now = time.time()
+        if (self._active_cache is not None and
+                (now - self._active_cache[0]) < self.STATE_CACHE_TTL):
+            return self._active_cache[1]
+
+        active = os.path.exists(self.get_path())
+        self._active_cache = (now, active)
+        return active
 
     def snapshot(self, destination_volume, size):
         """Snapshot volume."""
@@ -185,6 +299,8 @@ class LvmVolume(BaseVolume):
                 "Error whilst snapshotting disk:\n" + str(exc)
             )
 
+        destination_volume._invalidate_state_cache()
+
     def undo__snapshot(self, destination_volume, *args, **kwargs):
         """Undo snapshot created."""
         destination_volume.delete()
@@ -211,7 +327,22 @@ class LvmVolume(BaseVolume):
         self.ensure_exists()
 
         # Get size of current disk, to be able to roll back to current size
-        _f.add_undo_argument(original_size=self.get_size())
+        original_size = self.get_size()
+        _f.add_undo_argument(original_size=original_size)
+
+        # Resize through the LVM bindings, where available, which require
+        # an absolute target size
+        if BlockDev is not None:
+            target_size = (original_size + size) if increase else size
+            try:
+                BlockDev.lvm_lvresize(self.storage_backend.get_location(),
+                                      self.name, int(target_size))
+            except GLib.Error, exc:
+                raise ExternalStorageCommandErrorException(
+                    "Error whilst resizing disk:\n" + str(exc)
+                )
+            self._invalidate_state_cache()
+            return
 
         # If increasing disk size, prepend with plus (+)
         if increase:
@@ -229,23 +360,64 @@ class LvmVolume(BaseVolume):
                 "Error whilst resizing disk:\n" + str(exc)
             )
 
+        self._invalidate_state_cache()
+
     def undo__resize(self, original_size, *args, **kwargs):
         """Rerun resize to set volume back to the orignial size."""
         self.resize(size=original_size, increase=False)
 
     def check_exists(self):
         """Determine whether logical volume exists."""
-        return os.path.lexists(self.get_path())
+        # Re-use a recently-cached result, to avoid a syscall per
+        # disk whilst enumerating volumes in batch operations
+        now = time.time()
+        if (self._exists_cache is not None and
+                (now - self._exists_cache[0]) < self.STATE_CACHE_TTL):
+            return self._exists_cache[1]
+
+        exists = os.path.lexists(self.get_path())
+        self._exists_cache = (now, exists)
+        return exists
+
+    def _get_device_mtime(self):
+        """Return the mtime of the volume device node, or None if unobtainable."""
+        try:
+            return os.stat(self.get_path()).st_mtime
+        except OSError:
+            return None
 
     @Expose(remote_nodes=True)
     def get_size(self):
         """Obtain the size of a logical volume."""
         self.ensure_exists()
-        # Use 'lvs' to obtain the size of the disk
+
+        # Return the cached size if the device node has not been
+        # modified since the size was last obtained
+        mtime = self._get_device_mtime()
+        if (self._size_cache is not None and mtime is not None and
+                self._size_cache[0] == mtime):
+            return self._size_cache[1]
+
+        # Obtain the size through the LVM bindings, where available
+        if BlockDev is not None:
+            try:
+                lv_size = int(BlockDev.lvm_lvinfo(
+                    self.storage_backend.get_location(), self.name).size)
+            except GLib.Error, exc:
+                raise ExternalStorageCommandErrorException(
+                    "Error whilst obtaining the size of the logical volume:\n" +
+                    str(exc))
+            self._size_cache = (mtime, lv_size)
+            return lv_size
+
+        # Use 'lvs' to obtain the size of the disk, using the JSON report
+        # format, which provides a byte-precise integer without relying
+        # on slicing headerless text output
         command_args = (
             'lvs',
+            '--reportformat',
+            'json',
             '--nosuffix',
-            '--noheadings',
             '--units',
             'b',
             '--options',
@@ -258,5 +430,6 @@ class LvmVolume(BaseVolume):
                 "Error whilst obtaining the size of the logical volume:\n" +
                 str(exc))
 
-        lv_size = command_output.strip().split('.')[0]
-        return int(lv_size)
+        lv_size = int(json.loads(command_output)['report'][0]['lv'][0]['lv_size'])
+        self._size_cache = (mtime, lv_size)
+        return lv_size
@@ -41,10 +41,15 @@ class System(object):
             stderr=subprocess.PIPE,
             cwd=cwd)
         Syslogger.logger().debug('Started system command: %s' % ', '.join(command_args))
-        rc = command_process.wait()
-        stdout = command_process.stdout.read().decode(
+        # Use communicate, rather than wait/read, so that the thread blocks
+        # in the underlying read syscalls (releasing the GIL, allowing other
+        # RPC threads to continue) and output is consumed whilst the command
+        # runs, avoiding a deadlock if the command fills a pipe buffer
+        stdout, stderr = command_process.communicate()
+        rc = command_process.returncode
+        stdout = stdout.decode(
             'utf8', errors='backslashreplace').replace('\r', '')
-        stderr = command_process.stderr.read().decode(
+        stderr = stderr.decode(
             'utf8', errors='backslashreplace').replace('\r', '')
         if rc and raise_exception_on_failure:
             Syslogger.logger().error("Failed system command: %s\nRC: %s\nStdout: %s\nStderr: %s" %
@@ -307,6 +307,9 @@ class Base(PyroObject):
         """Remove hard drive config."""
         self.get_config_object().delete()
 
+        # Remove cached pyro object
+        self.po__get_registered_object('hard_drive_factory').uncache_object(self.id_)
+
     def duplicate(self, destination_vm_object, storage_backend=None):
         """Clone the hard drive and attach it to the new VM object."""
         self.ensure_exists()
@@ -90,6 +90,9 @@
 #########################################################################################
 """
 
+from collections import OrderedDict
+from threading import Lock
+
 from texttable import Texttable
 
 from mcvirt.exceptions import (UnknownStorageTypeException, HardDriveDoesNotExistException,
@@ -115,7 +118,19 @@ class Factory(PyroObject):
     DEFAULT_STORAGE_TYPE = 'Local'
     OBJECT_TYPE = 'hard disk'
     HARD_DRIVE_CLASS = Base
-    CACHED_OBJECTS = {}
+    CACHED_OBJECTS = OrderedDict()
+    # Guards all mutations of CACHED_OBJECTS, as the daemon serves
+    # requests from multiple threads
+    _CACHED_OBJECTS_LOCK = Lock()
+    # Maximum number of hard drive objects held in the cache before the
+    # least-recently-used objects are evicted
+    CACHED_OBJECTS_MAXSIZE = 256
+    # Cache of storage types available on the node, invalidated when
+    # storage backends are added/removed
+    _available_storage_types_cache = None
+    _available_storage_type_names_cache = None
+    # Map of storage type name to class, computed on first use
+    _storage_type_map = None
 
     @Expose()
     def get_object_by_vm_and_attachment_id(self, vm_object, attachment_id):
@@ -127,15 +142,55 @@ class Factory(PyroObject):
     @Expose()
     def get_object(self, id_):
         """Returns the storage object for a given disk."""
+        # Fast path: the overwhelmingly common case is that the object is
+        # already cached - return it without touching the hard drive
+        # config. The lookup itself is non-destructive, so concurrent
+        # hits for the same object cannot race each other into a miss
+        hard_drive_object = Factory.CACHED_OBJECTS.get(id_)
+        if hard_drive_object is not None:
+            # Mark the entry as most-recently-used under the cache lock,
+            # checking it still holds the same object, as it may have
+            # been removed/replaced in the meantime
+            with Factory._CACHED_OBJECTS_LOCK:
+                if Factory.CACHED_OBJECTS.get(id_) is hard_drive_object:
+                    del Factory.CACHED_OBJECTS[id_]
+                    Factory.CACHED_OBJECTS[id_] = hard_drive_object
+            return hard_drive_object
+
+        # Otherwise, determine the storage type from the config and
+        # create/register the object
+        base_hdd = Base(id_)
+        storage_type = base_hdd.get_type()
+        hard_drive_object = self.get_class(storage_type)(id_)
+        self.po__register_object(hard_drive_object)
+
+        with Factory._CACHED_OBJECTS_LOCK:
+            # Another thread may have cached the object whilst this one
+            # was being created - return the cached instance, rather than
+            # inserting a duplicate
+            if id_ in Factory.CACHED_OBJECTS:
+                self.po__unregister_object(obj=hard_drive_object)
+                return Factory.CACHED_OBJECTS[id_]
 
-        if id_ not in Factory.CACHED_OBJECTS:
-            base_hdd = Base(id_)
-            storage_type = base_hdd.get_type()
-            hard_drive_object = self.get_class(storage_type)(id_)
-            self.po__register_object(hard_drive_object)
             Factory.CACHED_OBJECTS[id_] = hard_drive_object
 
-        return Factory.CACHED_OBJECTS[id_]
+            # Evict least-recently-used objects once the cache is full,
+            # so that the cache does not grow unbounded over the life of
+            # the daemon. Evicted objects are left registered with the
+            # daemon, as other threads and remote clients may still hold
+            # references to them - objects are only un-registered once
+            # the disk is actually deleted (see uncache_object)
+            while len(Factory.CACHED_OBJECTS) > Factory.CACHED_OBJECTS_MAXSIZE:
+                Factory.CACHED_OBJECTS.popitem(last=False)
+
+        return hard_drive_object
+
+    def uncache_object(self, id_):
+        """Remove a hard drive object from the object cache, once deleted."""
+        with Factory._CACHED_OBJECTS_LOCK:
+            hard_drive_object = Factory.CACHED_OBJECTS.pop(id_, None)
+        if hard_drive_object is not None:
+            self.po__unregister_object(obj=hard_drive_object)
 
     def get_remote_object(self,
                           node=None,  # The name of the remote node to connect to
@@ -157,8 +212,7 @@ class Factory(PyroObject):
         # we can assume that Local storage is used.
         available_storage_types = self._get_available_storage_types()
         if storage_type:
-            if (storage_type not in
-                    [available_storage.__name__ for available_storage in available_storage_types]):
+            if storage_type not in self._get_available_storage_type_names():
                 raise UnknownStorageTypeException('%s is not supported by node %s' %
                                                   (storage_type, get_hostname()))
         else:
@@ -413,14 +467,38 @@ class Factory(PyroObject):
 
     def _get_available_storage_types(self):
         """Returns a list of storage types that are available on the node."""
+        # Return cached result, as determining availability queries the
+        # storage backends for each storage type, which is re-performed
+        # for every disk during bulk creation
+        if self._available_storage_types_cache is not None:
+            return self._available_storage_types_cache
+
         available_storage_types = []
         storage_factory = self.po__get_registered_object('storage_factory')
         node_drbd = self.po__get_registered_object('node_drbd')
         for storage_type in self.get_all_storage_types():
             if storage_type.isAvailable(storage_factory, node_drbd):
                 available_storage_types.append(storage_type)
+        self._available_storage_types_cache = available_storage_types
         return available_storage_types
 
+    def _get_available_storage_type_names(self):
+        """Return a set of the names of the available storage types."""
+        if self._available_storage_type_names_cache is None:
+            self._available_storage_type_names_cache = set(
+                storage_type.__name__
+                for storage_type in self._get_available_storage_types())
+        return self._available_storage_type_names_cache
+
+    def invalidate_available_storage_types(self):
+        """Clear the cache of available storage types.
+
+        Called when storage backends are added/removed or DRBD is enabled,
+        as these affect which storage types are available on the node.
+        """
+        self._available_storage_types_cache = None
+        self._available_storage_type_names_cache = None
+
     def get_all_storage_types(self):
         """Returns the available storage types that MCVirt provides."""
         return get_all_submodules(Base)
@@ -469,9 +547,15 @@ class Factory(PyroObject):
         if allow_base and not storage_type:
             return Base
 
-        for hard_drive_class in self.get_all_storage_types():
-            if storage_type == hard_drive_class.__name__:
-                return hard_drive_class
+        # Compute the name-to-class map once, providing O(1) dispatch,
+        # rather than iterating the storage types on every call
+        if Factory._storage_type_map is None:
+            Factory._storage_type_map = {
+                hard_drive_class.__name__: hard_drive_class
+                for hard_drive_class in self.get_all_storage_types()}
+
+        if storage_type in Factory._storage_type_map:
+            return Factory._storage_type_map[storage_type]
         raise UnknownStorageTypeException(
             'Attempted to initialise an unknown storage type: %s' %
             (storage_type)